@@ -2,6 +2,7 @@ from __future__ import annotations  # not necessary in 3.10
 import asyncio
 import aiohttp
 import logging
+import random
 from aiohttp.client_exceptions import ClientConnectorError
 from .task import Task, Instruction
 from .queue import Queue
@@ -21,16 +22,19 @@ class AuditorClient:
         retries: int = 5,
         num_workers: int = 1,
         delay_before_retry: int = 5,
+        max_delay_before_retry: int = 300,
         db: DB = DBsqlite(),
     ) -> AuditorClient:
         self._host = host
         self._port = port
+        self._url = f"http://{host}:{port}"
         self._session = None
         self._queue = Queue(db=db)
         self._timeout = aiohttp.ClientTimeout(total=timeout)
         self._retries = retries
         self._num_workers = num_workers
         self._delay_before_retry = delay_before_retry
+        self._max_delay_before_retry = max_delay_before_retry
         self._logger = logging.getLogger("auditorclient.client.AuditorClient")
 
     async def start(self) -> None:
@@ -47,7 +51,7 @@ class AuditorClient:
         logging.info("Stopping client, waiting until queue is empty.")
         await self._queue.join()
         for w in self._workers:
-            self._logger.debug(f"Stopping worker {w}")
+            self._logger.debug("Stopping worker %s", w)
             w.cancel()
         await self._session.close()
 
@@ -63,19 +67,19 @@ class AuditorClient:
                         except RecordExistsError:
                             self._logger.warning(
                                 f"Worker {worker_id}: "
-                                + f"Record {record.record_id()} of site {record.site_id()}"
-                                + " not sent and not requeued."
+                                f"Record {record.record_id()} of site {record.site_id()}"
+                                " not sent and not requeued."
                             )
                         except ClientConnectorError:
                             self._logger.warning(
                                 f"Worker {worker_id}: "
                                 f"Connection refused. Requeuing record {record.record_id()}"
-                                + f" of site {record.site_id()} "
-                                + f"({self._retries-token.retries()}/{self._retries})."
+                                f" of site {record.site_id()} "
+                                f"({self._retries-token.retries()}/{self._retries})."
                             )
                             if token.retries() > 0:
                                 await self._queue.put(
-                                    token, wait_for_sec=self._delay_before_retry
+                                    token, wait_for_sec=self._retry_delay(token)
                                 )
                         except Exception as e:
                             self._logger.error(e)
@@ -86,22 +90,22 @@ class AuditorClient:
                             self._logger.warning(
                                 f"Worker {worker_id}: "
                                 f"Record {record.record_id()} of site {record.site_id()}"
-                                + " not sent, requeueing."
+                                " not sent, requeueing."
                             )
                             if token.retries() > 0:
                                 await self._queue.put(
-                                    token, wait_for_sec=self._delay_before_retry
+                                    token, wait_for_sec=self._retry_delay(token)
                                 )
                         except ClientConnectorError:
                             self._logger.warning(
                                 f"Worker {worker_id}: "
                                 f"Connection refused. Requeuing record {record.record_id()}"
-                                + f" of site {record.site_id()} "
-                                + f"({self._retries-token.retries()}/{self._retries})."
+                                f" of site {record.site_id()} "
+                                f"({self._retries-token.retries()}/{self._retries})."
                             )
                             if token.retries() > 0:
                                 await self._queue.put(
-                                    token, wait_for_sec=self._delay_before_retry
+                                    token, wait_for_sec=self._retry_delay(token)
                                 )
                         except Exception as e:
                             self._logger.error(e)
@@ -109,62 +113,106 @@ class AuditorClient:
             except Exception as e:
                 self._logger.warning(f"Worker {worker_id}: Exception: {e}")
 
+    def _retry_delay(self, token: Task) -> float:
+        # Exponential backoff with jitter: the n-th retry of a task is delayed by a
+        # random time between half of and the full `delay_before_retry * 2**(n-1)`
+        # seconds, capped at `max_delay_before_retry`. Hence a server which is down is
+        # not hammered at a fixed rate, and tasks which failed at the same time are not
+        # all retried at the same time again.
+        attempt = self._retries - token.retries()
+        delay = min(
+            self._delay_before_retry * 2 ** (attempt - 1), self._max_delay_before_retry
+        )
+        return random.uniform(delay / 2, delay)
+
     async def add_record_queue(self, record: Record) -> None:
-        self._logger.debug(f"Adding ADD record to queue: {record}")
+        self._logger.debug("Adding ADD record to queue: %s", record)
         await self._queue.put(Task(Instruction.ADD, record, retries=self._retries))
 
     async def update_record_queue(self, record: Record) -> None:
-        self._logger.debug(f"Adding UPDATE record to queue: {record}")
+        self._logger.debug("Adding UPDATE record to queue: %s", record)
         await self._queue.put(Task(Instruction.UPDATE, record, retries=self._retries))
 
+    async def add_records_queue(self, records: [Record]) -> None:
+        self._logger.debug("Adding %d ADD records to queue", len(records))
+        await self._queue.put_many(
+            [Task(Instruction.ADD, record, retries=self._retries) for record in records]
+        )
+
+    async def update_records_queue(self, records: [Record]) -> None:
+        self._logger.debug("Adding %d UPDATE records to queue", len(records))
+        await self._queue.put_many(
+            [
+                Task(Instruction.UPDATE, record, retries=self._retries)
+                for record in records
+            ]
+        )
+
     async def add_record(self, record: Record):
         self._logger.debug(
-            f"Adding record {record} to AUDITOR instance running at"
-            + f" http://{self._host}:{self._port}"
+            "Adding record %s to AUDITOR instance running at %s", record, self._url
         )
         async with self._session.post(
-            f"http://{self._host}:{self._port}/add",
+            f"{self._url}/add",
             data=record.as_json(),
         ) as response:
             if response.status == 409:
                 self._logger.warning(
                     f"Record {record.record_id()} of site {record.site_id()} already exists at"
-                    + f" http://{self._host}:{self._port}."
+                    f" {self._url}."
                 )
                 raise RecordExistsError(record.record_id(), record.site_id())
             return response
 
+    async def add_records(self, records: [Record]):
+        self._logger.debug(
+            "Adding %d records to AUDITOR instance running at %s",
+            len(records),
+            self._url,
+        )
+        # All records are sent with a single request. The body is assembled from the
+        # records' JSON representations, which are reused if serialized before.
+        async with self._session.post(
+            f"{self._url}/add/bulk",
+            data=f"[{','.join(record.as_json() for record in records)}]",
+        ) as response:
+            # The server stores either all records or none of them.
+            if not response.ok:
+                self._logger.warning(
+                    f"None of the {len(records)} records were added to {self._url}"
+                    f" (status {response.status})."
+                )
+                response.raise_for_status()
+            return response
+
     async def update_record(self, record: Record) -> str:
         self._logger.debug(
-            f"Updating record {record} of AUDITOR instance running at"
-            + f" http://{self._host}:{self._port}"
+            "Updating record %s of AUDITOR instance running at %s", record, self._url
         )
         async with self._session.post(
-            f"http://{self._host}:{self._port}/update",
+            f"{self._url}/update",
             data=record.as_json(),
         ) as response:
             if response.status == 400:
                 self._logger.warning(
                     f"Record {record.record_id()} of site {record.site_id()} cannot be updated "
-                    + f"because it does not exist at http://{self._host}:{self._port}."
+                    f"because it does not exist at {self._url}."
                 )
                 raise RecordDoesNotExistError(record.record_id(), record.site_id())
             return response
 
     async def get(self) -> dict:
-        async with self._session.get(
-            f"http://{self._host}:{self._port}/get"
-        ) as response:
+        async with self._session.get(f"{self._url}/get") as response:
             return await response.json()
 
     async def get_started_since(self, timestamp: str) -> dict:
         async with self._session.get(
-            f"http://{self._host}:{self._port}/get/started/since/{timestamp}"
+            f"{self._url}/get/started/since/{timestamp}"
         ) as response:
             return await response.json()
 
     async def get_stopped_since(self, timestamp: str) -> dict:
         async with self._session.get(
-            f"http://{self._host}:{self._port}/get/stopped/since/{timestamp}"
+            f"{self._url}/get/stopped/since/{timestamp}"
         ) as response:
             return await response.json()
@@ -1,12 +1,51 @@
 from __future__ import annotations  # not necessary in 3.10
 from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from typing import Optional
 import aiosqlite
-import os.path
+import asyncio
+import datetime
 import logging
-from dateutil import parser
 from .task import Task, Instruction
 from .record import Record, Components, Scores
 
+_SQLITE_CREATE_TABLE = """
+    CREATE TABLE IF NOT EXISTS auditorclient
+    (
+        record_id VARCHAR(50) NOT NULL,
+        site_id VARCHAR(50) NOT NULL,
+        instruction INT NOT NULL,
+        record TEXT NOT NULL,
+        retries INT NOT NULL,
+        schedule_after TIMESTAMP,
+        PRIMARY KEY (record_id, site_id, instruction)
+    );
+"""
+_SQLITE_PRAGMAS = ("PRAGMA journal_mode=WAL", "PRAGMA synchronous=NORMAL")
+# record_id and site_id are contained in the serialized record already, hence only the
+# columns needed for restoring the tasks are fetched.
+_SQLITE_SELECT_ALL = (
+    "SELECT instruction, record, retries, schedule_after FROM auditorclient"
+)
+# A task which is already stored (same record, site and instruction) is replaced by
+# the newer one, instead of failing the whole (possibly batched) insert.
+_SQLITE_INSERT = "INSERT OR REPLACE INTO auditorclient VALUES (?, ?, ?, ?, ?, ?)"
+_SQLITE_COUNT = "SELECT COUNT(*) FROM auditorclient"
+# Values are passed as parameters, such that the statement text is always the same and
+# the compiled statement is reused from sqlite's statement cache.
+_SQLITE_DELETE = (
+    "DELETE FROM auditorclient WHERE record_id=? AND site_id=? AND instruction=?"
+)
+
+
+def _parse_schedule_after(value: str) -> Optional[datetime.datetime]:
+    # schedule_after is stored as str(datetime), which is exactly the ISO format
+    # understood by the much faster datetime.fromisoformat. Naive timestamps stored by
+    # older versions are converted to UTC by Task.with_schedule_after.
+    if value == "None":
+        return None
+    return datetime.datetime.fromisoformat(value)
+
 
 class DB(ABC):
     @abstractmethod
@@ -29,6 +68,10 @@ class DB(ABC):
     def delete(self, task: Task):
         pass
 
+    async def put_many(self, tasks: [Task]):
+        for task in tasks:
+            await self.put(task)
+
 
 class DBsqlite(DB):
     def __init__(self, filename: str = "database.db"):
@@ -36,89 +79,127 @@ class DBsqlite(DB):
         self._logger = logging.getLogger("auditorclient.dbsqlite.DBsqlite")
 
     async def start(self):
-        self._logger.debug(f"Starting DBsqlite database ({self._filename})")
-        if not os.path.isfile(self._filename):
-            self._logger.debug(
-                f"DBsqlite: database file {self._filename} not"
-                + " found, initializing empty database."
-            )
-            self._db = await aiosqlite.connect(self._filename)
-            cur = await self._db.execute(
-                """
-                    CREATE TABLE auditorclient
-                    (
-                        record_id VARCHAR(50) NOT NULL,
-                        site_id VARCHAR(50) NOT NULL,
-                        instruction INT NOT NULL,
-                        record TEXT NOT NULL,
-                        retries INT NOT NULL,
-                        schedule_after TIMESTAMP,
-                        PRIMARY KEY (record_id, site_id, instruction)
-                    );
-                """
-            )
+        self._logger.debug("Starting DBsqlite database (%s)", self._filename)
+        # All workers share the one connection. The lock keeps their writes out of a
+        # transaction which is open on it, see `transaction`.
+        self._lock = asyncio.Lock()
+        self._transaction_owner = None
+        self._db = await aiosqlite.connect(self._filename, isolation_level=None)
+        # With write-ahead logging each commit appends to the log instead of rewriting
+        # the rollback journal, and in this mode synchronous=NORMAL only syncs at
+        # checkpoints. Committed tasks still survive a crash of the client itself.
+        for pragma in _SQLITE_PRAGMAS:
+            cur = await self._db.execute(pragma)
             await cur.close()
-        else:
-            self._db = await aiosqlite.connect(self._filename)
+        # Creating the table is a no-op if it exists already. This also covers existing
+        # but empty database files, which were not initialized before.
+        cur = await self._db.execute(_SQLITE_CREATE_TABLE)
+        await cur.close()
 
     async def close(self):
         self._logger.debug("Closing database connection")
         await self._db.close()
 
+    @asynccontextmanager
+    async def transaction(self):
+        # The connection runs in autocommit mode, hence every statement is committed
+        # (and synced to disk) on its own. Statements issued inside this context manager
+        # are grouped into a single transaction instead. The lock is held until the
+        # transaction is finished, hence statements of other tasks neither become part
+        # of it nor try to open a second transaction on the same connection.
+        if self._transaction_owner is asyncio.current_task():
+            # Nested use just joins the transaction which is open already.
+            yield
+            return
+        async with self._lock:
+            self._transaction_owner = asyncio.current_task()
+            try:
+                cur = await self._db.execute("BEGIN IMMEDIATE")
+                await cur.close()
+                try:
+                    yield
+                except BaseException:
+                    cur = await self._db.execute("ROLLBACK")
+                    await cur.close()
+                    raise
+                cur = await self._db.execute("COMMIT")
+                await cur.close()
+            finally:
+                self._transaction_owner = None
+
+    @asynccontextmanager
+    async def _locked(self):
+        # Within a transaction the owning task holds the lock already.
+        if self._transaction_owner is asyncio.current_task():
+            yield
+        else:
+            async with self._lock:
+                yield
+
     async def delete(self, task: Task):
-        self._logger.debug(f"DBsqlite: Deleting task from database: {task}")
+        self._logger.debug("DBsqlite: Deleting task from database: %s", task)
         instr = task.instr()
         record = task.record()
-        cur = await self._db.execute(
-            f"""
-                DELETE
-                FROM auditorclient
-                WHERE record_id='{record.record_id()}'
-                AND site_id='{record.site_id()}'
-                AND instruction={instr.value}
-            """
-        )
-        await self._db.commit()
-        await cur.close()
+        async with self._locked():
+            cur = await self._db.execute(
+                _SQLITE_DELETE, (record.record_id(), record.site_id(), instr.value)
+            )
+            await cur.close()
 
     async def get_all(self) -> [Task]:
         self._logger.debug("DBsqlite: Retrieving entire database")
-        cur = await self._db.execute(
-            """
-                SELECT * FROM auditorclient
-            """
-        )
-        rows = await cur.fetchall()
-        return [
+        cur = await self._db.execute(_SQLITE_SELECT_ALL)
+        # Build the tasks while iterating over the cursor instead of materializing all
+        # rows with fetchall() first, such that only one copy of the stored data is held
+        # at a time.
+        tasks = [
             Task(
-                Instruction(row[2]),
-                Record(json_str=row[3]),
-                row[4],
-            ).with_schedule_after(parser.parse(row[5]) if row[5] != "None" else None)
-            for row in rows
+                Instruction(row[0]),
+                Record(json_str=row[1]),
+                row[2],
+            ).with_schedule_after(_parse_schedule_after(row[3]))
+            async for row in cur
         ]
+        await cur.close()
+        return tasks
 
     async def put(self, task: Task):
-        self._logger.debug(f"DBsqlite: Adding task to database: {task}")
-        instr = task.instr()
+        self._logger.debug("DBsqlite: Adding task to database: %s", task)
+        async with self._locked():
+            cur = await self._db.execute(_SQLITE_INSERT, self._to_row(task))
+            await cur.close()
+
+    async def put_many(self, tasks: [Task]):
+        self._logger.debug("DBsqlite: Adding %d tasks to database", len(tasks))
+        async with self.transaction():
+            count = await self._count()
+            cur = await self._db.executemany(
+                _SQLITE_INSERT, (self._to_row(task) for task in tasks)
+            )
+            await cur.close()
+            replaced = len(tasks) - (await self._count() - count)
+        if replaced:
+            self._logger.info(
+                "DBsqlite: Replaced %d tasks which were stored already", replaced
+            )
+
+    async def _count(self) -> int:
+        cur = await self._db.execute(_SQLITE_COUNT)
+        (count,) = await cur.fetchone()
+        await cur.close()
+        return count
+
+    @staticmethod
+    def _to_row(task: Task) -> tuple:
         record = task.record()
-        retries = task.retries()
-        schedule_after = task.schedule_after()
-        cur = await self._db.execute(
-            f"""
-                INSERT INTO auditorclient VALUES
-                (
-                    '{record.record_id()}',
-                    '{record.site_id()}',
-                    {instr.value},
-                    '{record.as_json()}',
-                    {retries},
-                    '{schedule_after}'
-                )
-            """
+        return (
+            record.record_id(),
+            record.site_id(),
+            task.instr().value,
+            record.as_json(),
+            task.retries(),
+            str(task.schedule_after()),
         )
-        await self._db.commit()
-        await cur.close()
 
 
 class MockDB(DB):
@@ -1,6 +1,7 @@
 import logging
 import asyncio
-from datetime import datetime
+import itertools
+from datetime import datetime, timezone
 from .db import DB, DBsqlite
 from .task import Task
 
@@ -14,7 +15,15 @@ class Queue:
         # such a case the `UPDATE` would get lost, while the `ADD` will be executed
         # later on. This can cause inconsistencies/incomplete information in the
         # auditor database.
+        # The entries are (instruction, sequence number, task) tuples, such that the
+        # ordering is decided by plain tuple comparison instead of calling Task.__lt__
+        # for every comparison. The sequence number keeps tasks with the same
+        # instruction in FIFO order.
         self._queue = None
+        self._seq = itertools.count()
+        # Latest queued task per record, site and instruction. Like in the database, a
+        # newer task replaces an older one, which is then skipped by `get`.
+        self._pending = {}
         self._sleep_time = sleep_time
         self._db = db
         self._logger = logging.getLogger("auditorclient.queue.Queue")
@@ -26,16 +35,22 @@ class Queue:
             await self._db.start()
             tasks = await self._db.get_all()
             for task in tasks:
-                self._logger.debug(f"Restored task from database: {task}")
-                await self._queue.put(task)
+                self._logger.debug("Restored task from database: %s", task)
+                await self._enqueue(task)
 
     async def get(self) -> Task:
         while True:
-            task = await self._queue.get()
+            _, _, task = await self._queue.get()
             #  self._logger.debug(f"Got task from queue: {task}")
+            key = self._key(task)
+            if self._pending.get(key) is not task:
+                self._logger.debug("Skipping replaced task: %s", task)
+                self._queue.task_done()
+                continue
             schedule_after = task.schedule_after()
-            if schedule_after is None or datetime.now() > schedule_after:
-                self._logger.debug(f"Returning task: {task}")
+            if schedule_after is None or datetime.now(timezone.utc) > schedule_after:
+                self._logger.debug("Returning task: %s", task)
+                del self._pending[key]
                 task.wait_for_sec(None)
                 if self._db:
                     await self._db.delete(task)
@@ -44,12 +59,29 @@ class Queue:
                 #  self._logger.debug(f"Task cannot be scheduled yet: {task}")
                 await asyncio.sleep(self._sleep_time)
                 self._queue.task_done()
-                await self._queue.put(task)
+                await self._enqueue(task)
+
+    @staticmethod
+    def _key(task: Task) -> tuple:
+        record = task.record()
+        return (record.record_id(), record.site_id(), task.instr())
+
+    async def _enqueue(self, task: Task) -> None:
+        self._pending[self._key(task)] = task
+        await self._queue.put((task.instr(), next(self._seq), task))
 
     async def put(self, task: Task, wait_for_sec: int = None) -> None:
+        task.wait_for_sec(wait_for_sec)
+        if self._db is not None:
+            await self._db.put(task)
+        await self._enqueue(task)
+
+    async def put_many(self, tasks: [Task], wait_for_sec: int = None) -> None:
+        tasks = [task.wait_for_sec(wait_for_sec) for task in tasks]
         if self._db is not None:
-            await self._db.put(task.wait_for_sec(wait_for_sec))
-        await self._queue.put(task.wait_for_sec(wait_for_sec))
+            await self._db.put_many(tasks)
+        for task in tasks:
+            await self._enqueue(task)
 
     def task_done(self) -> None:
         self._queue.task_done()
@@ -4,11 +4,46 @@ from __future__ import annotations  # not necessary in 3.10
 import json
 from .errors import InsufficientParametersError
 
+# orjson parses considerably faster than the standard library and is used for reading
+# records if it is installed. Serialization stays with the standard library, since its
+# output format (e.g. whitespace) is relied upon.
+try:
+    import orjson
+except ImportError:
+    json_loads = json.loads
+else:
+
+    def json_loads(json_str):
+        try:
+            return orjson.loads(json_str)
+        except orjson.JSONDecodeError:
+            # json.dumps writes non-finite floats as NaN/Infinity, which orjson rejects.
+            return json.loads(json_str)
+
 
 class Components:
+    __slots__ = ("_components",)
+
     def __init__(self):
         self._components = []
 
+    @classmethod
+    def from_list(cls, components: [dict]) -> Components:
+        # The components are taken over as plain dicts, in the same form add_component
+        # and add_score would produce, without building a Scores object per component.
+        c = cls()
+        c._components = [
+            {
+                "name": comp["name"],
+                "amount": comp["amount"],
+                "scores": [
+                    {"name": s["name"], "factor": s["factor"]} for s in comp["scores"]
+                ],
+            }
+            for comp in components
+        ]
+        return c
+
     def __str__(self) -> str:
         return self._components.__str__()
 
@@ -26,9 +61,11 @@ class Components:
         return self._components
 
 class Scores:
+    __slots__ = ("_scores",)
+
     def __init__(self, json_str=None):
         if json_str is not None:
-            self._scores = json.loads(json_str)
+            self._scores = json_loads(json_str)
         else:
             self._scores = []
 
@@ -47,6 +84,17 @@ class Scores:
 
 
 class Record:
+    __slots__ = (
+        "_record_id",
+        "_site_id",
+        "_user_id",
+        "_group_id",
+        "_components",
+        "_start_time",
+        "_stop_time",
+        "_json",
+    )
+
     def __init__(
         self,
         record_id: str = None,
@@ -69,26 +117,25 @@ class Record:
             self._site_id = site_id
             self._user_id = user_id
             self._group_id = group_id
-            self._components = components
+            # The record keeps its own copy of the components, such that changes to the
+            # caller's object can not bypass the cached serialization (see `as_json`).
+            self._components = Components.from_list(components.get())
             self._start_time = None
             self._stop_time = None
             #  self._runtime = None
         else:
-            d = json.loads(json_str)
-            c = Components()
-            for comp in d["components"]:
-                score = Scores()
-                for s in comp["scores"]:
-                    score.add_score(s["name"], s["factor"])
-                c.add_component(comp["name"], comp["amount"], score)
+            d = json_loads(json_str)
             self._record_id = d["record_id"]
             self._site_id = d["site_id"]
             self._user_id = d["user_id"]
             self._group_id = d["group_id"]
-            self._components = c
+            self._components = Components.from_list(d["components"])
             self._start_time = d["start_time"]
             self._stop_time = d["stop_time"]
             #  self._runtime = d["runtime"]
+        # Serialized form of the record, computed lazily by `as_json` and reset by every
+        # method changing the record.
+        self._json = None
 
     def __str__(self) -> str:
         return self.as_dict().__str__()
@@ -106,10 +153,12 @@ class Record:
 
     def with_start_time(self, start_time: str) -> Record:
         self._start_time = start_time
+        self._json = None
         return self
 
     def with_stop_time(self, stop_time: str) -> Record:
         self._stop_time = stop_time
+        self._json = None
         return self
 
     def record_id(self) -> str:
@@ -130,4 +179,8 @@ class Record:
         }
 
     def as_json(self) -> str:
-        return json.dumps(self.as_dict())
+        # A record is serialized at least twice (when it is persisted in the queue's
+        # database and when it is sent), hence it is kept until the record changes.
+        if self._json is None:
+            self._json = json.dumps(self.as_dict())
+        return self._json
@@ -12,6 +12,8 @@ class Instruction(IntEnum):
 
 
 class Task:
+    __slots__ = ("_instr", "_record", "_retries", "_schedule_after")
+
     def __init__(self, instr: Instruction, record: Record, retries: int):
         self._instr = instr
         self._record = record
@@ -42,14 +44,19 @@ class Task:
         return self._retries
 
     def with_schedule_after(self, schedule_after: datetime.datetime) -> Task:
+        # Naive timestamps are taken as local time and converted to UTC, otherwise they
+        # could not be compared to the timezone aware ones used by the queue.
+        if schedule_after is not None and schedule_after.tzinfo is None:
+            schedule_after = schedule_after.astimezone(datetime.timezone.utc)
         self._schedule_after = schedule_after
         return self
 
     def wait_for_sec(self, time: int) -> Task:
         if time is not None:
-            self._schedule_after = datetime.datetime.now() + datetime.timedelta(
-                seconds=time
-            )
+            # Timestamps are kept in UTC, which is independent of the local timezone
+            # (and its DST jumps) and saves the conversion to local time on every call.
+            now = datetime.datetime.now(datetime.timezone.utc)
+            self._schedule_after = now + datetime.timedelta(seconds=time)
         else:
             self._schedule_after = None
         return self
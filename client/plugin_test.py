@@ -14,19 +14,16 @@ from math import floor
 def compute_cputime_per_group(response):
     data = {}
     for rec in response:
-        if rec["stop_time"]:
-            group_id = rec["group_id"]
-            if group_id not in data:
-                data[group_id] = {"count": 0, "cpu_time": 0.0}
-            data[group_id]["count"] += 1
-            print(rec["start_time"])
-            print(rec["stop_time"])
-            print(rec["components"])
-            data[group_id]["cpu_time"] += (
-                (parser.parse(rec["stop_time"]) - parser.parse(rec["start_time"]))
-                * rec["components"][0]["amount"]
-                * rec["components"][0]["scores"][0]["factor"]
-            ).total_seconds()
+        entry = data.setdefault(rec["group_id"], {"count": 0, "cpu_time": 0.0})
+        entry["count"] += 1
+        print(rec["start_time"])
+        print(rec["stop_time"])
+        print(rec["components"])
+        entry["cpu_time"] += (
+            (parser.parse(rec["stop_time"]) - parser.parse(rec["start_time"]))
+            * rec["components"][0]["amount"]
+            * rec["components"][0]["scores"][0]["factor"]
+        ).total_seconds()
     return data
 
 
@@ -52,7 +49,9 @@ async def main(client: AuditorClient):
     #  response = await client.get_since("2021-05-28T12:00:59.324310806Z")
     #  pprint(response)
 
-    response = await client.get()
+    # Only finished records contribute to the CPU time. Let the server select them
+    # instead of transferring all records and discarding the unfinished ones here.
+    response = await client.get_stopped_since("1970-01-01T00:00:00.000000Z")
     #  pprint(response)
 
     data = compute_cputime_per_group(response)
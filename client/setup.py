@@ -45,6 +45,7 @@ setup(
     ],
     extras_require={
         "docs": ["sphinx", "sphinx_rtd_theme", "sphinxcontrib-contentui"],
+        "orjson": ["orjson"],
         "test": TESTS_REQUIRE,
         "contrib": ["flake8", "flake8-bugbear", "black; implementation_name=='cpython'"]
         + TESTS_REQUIRE,
@@ -10,6 +10,8 @@ from aiohttp.client_exceptions import ClientConnectorError
 
 import json
 import aiohttp
+import aiohttp.test_utils
+import aiohttp.web
 import aiosqlite
 import asyncio
 import os
@@ -101,6 +103,15 @@ class TestAuditorClient(IsolatedAsyncioTestCase):
             mocked.post("http://localhost:8080/add", status=409)
             await client.add_record(record)
 
+        mocked.post("http://localhost:8080/add/bulk", status=200, body="test")
+        response = await client.add_records([record, record])
+        self.assertEqual(response.status, 200)
+        mocked.assert_called_with(
+            "http://localhost:8080/add/bulk",
+            method="POST",
+            data=f"[{record.as_json()},{record.as_json()}]",
+        )
+
         with self.assertRaises(RecordDoesNotExistError):
             mocked.post("http://localhost:8080/update", status=400)
             await client.update_record(record)
@@ -136,6 +147,65 @@ class TestAuditorClient(IsolatedAsyncioTestCase):
 
         await client.stop()
 
+    async def test_AuditorClient_add_records(self):
+        statuses = [200, 409, 500]
+        bodies = []
+
+        async def bulk_add(request):
+            bodies.append(await request.text())
+            return aiohttp.web.Response(status=statuses.pop(0))
+
+        app = aiohttp.web.Application()
+        app.router.add_post("/add/bulk", bulk_add)
+        async with aiohttp.test_utils.TestServer(app) as server:
+            client = AuditorClient(server.host, server.port, db=MockDB(empty_db=True))
+            await client.start()
+
+            record = Record(
+                "from_test",
+                "site",
+                "user",
+                "group",
+                Components().add_component(
+                    "comp1", 1, Scores().add_score("score1", 2.0)
+                ),
+            )
+
+            response = await client.add_records([record, record])
+            self.assertEqual(response.status, 200)
+            self.assertEqual(bodies[0], f"[{record.as_json()},{record.as_json()}]")
+
+            for status in [409, 500]:
+                with self.assertRaises(aiohttp.ClientResponseError) as cm:
+                    await client.add_records([record])
+                self.assertEqual(cm.exception.status, status)
+
+            await client.stop()
+
+    def test_AuditorClient_retry_delay(self):
+        client = AuditorClient(
+            "localhost",
+            8080,
+            retries=10,
+            delay_before_retry=2,
+            max_delay_before_retry=20,
+            db=MockDB(),
+        )
+        record = Record(
+            "from_test",
+            "site",
+            "user",
+            "group",
+            Components().add_component("comp1", 1, Scores().add_score("score1", 2.0)),
+        )
+        task = Task(Instruction.ADD, record, retries=10)
+        for upper in [2, 4, 8, 16, 20, 20]:
+            task.try_once()
+            for _ in range(20):
+                delay = client._retry_delay(task)
+                self.assertGreaterEqual(delay, upper / 2)
+                self.assertLessEqual(delay, upper)
+
     @aioresponses()
     async def test_AuditorClient_workers(self, mocked):
         client = AuditorClient(
@@ -5,6 +5,7 @@ from auditorclient.task import Task, Instruction
 
 import aiosqlite
 import asyncio
+import datetime
 import os
 from os.path import isfile
 
@@ -78,3 +79,186 @@ class TestDBsqlite(IsolatedAsyncioTestCase):
         self.assertEqual(tasks[0], task)
 
         await db.close()
+
+    async def test_DBsqlite_transaction(self):
+        db = DBsqlite(filename=self.test_db)
+        await db.start()
+
+        record = Record(
+            "record",
+            "site",
+            "user",
+            "group",
+            Components().add_component("comp1", 1, Scores().add_score("score1", 2.0)),
+        )
+        task = Task(Instruction.ADD, record, 5)
+
+        with self.assertRaises(RuntimeError):
+            async with db.transaction():
+                await db.put(task)
+                raise RuntimeError
+
+        self.assertEqual(await db.get_all(), [])
+
+        async with db.transaction():
+            await db.put(task)
+            await db.put(Task(Instruction.UPDATE, record, 5))
+
+        tasks = await db.get_all()
+        self.assertEqual(tasks, [task, Task(Instruction.UPDATE, record, 5)])
+
+        await db.close()
+
+    async def test_DBsqlite_nested_transaction(self):
+        db = DBsqlite(filename=self.test_db)
+        await db.start()
+
+        record = Record(
+            "record",
+            "site",
+            "user",
+            "group",
+            Components().add_component("comp1", 1, Scores().add_score("score1", 2.0)),
+        )
+        add = Task(Instruction.ADD, record, 5)
+        update = Task(Instruction.UPDATE, record, 5)
+
+        async def nested():
+            async with db.transaction():
+                await db.put_many([add])
+                async with db.transaction():
+                    await db.put(update)
+                raise RuntimeError
+
+        # put_many and the inner transaction join the outer one, which is rolled back
+        with self.assertRaises(RuntimeError):
+            await asyncio.wait_for(nested(), timeout=5)
+        self.assertEqual(await db.get_all(), [])
+
+        async with db.transaction():
+            await db.put_many([add])
+            await db.put(update)
+        self.assertEqual(await db.get_all(), [add, update])
+
+        await db.close()
+
+    async def test_DBsqlite_concurrent_writes(self):
+        db = DBsqlite(filename=self.test_db)
+        await db.start()
+
+        tasks = [
+            Task(
+                Instruction.ADD,
+                Record(
+                    f"record{i}",
+                    "site",
+                    "user",
+                    "group",
+                    Components().add_component(
+                        "comp1", 1, Scores().add_score("score1", 2.0)
+                    ),
+                ),
+                5,
+            )
+            for i in range(10)
+        ]
+
+        # concurrent batches do not open nested transactions
+        await asyncio.gather(db.put_many(tasks[:5]), db.put_many(tasks[5:]))
+
+        stored = sorted(await db.get_all(), key=lambda t: t.record().record_id())
+        self.assertEqual(stored, sorted(tasks, key=lambda t: t.record().record_id()))
+
+        # a delete issued while a transaction is open is not rolled back with it
+        async def failing_transaction():
+            async with db.transaction():
+                await db.put(Task(Instruction.UPDATE, tasks[1].record(), 5))
+                await asyncio.sleep(0.01)
+                raise RuntimeError
+
+        results = await asyncio.gather(
+            failing_transaction(), db.delete(tasks[0]), return_exceptions=True
+        )
+        self.assertIsInstance(results[0], RuntimeError)
+
+        stored = sorted(await db.get_all(), key=lambda t: t.record().record_id())
+        self.assertEqual(
+            stored, sorted(tasks[1:], key=lambda t: t.record().record_id())
+        )
+
+        await db.close()
+
+    async def test_DBsqlite_put_many(self):
+        db = DBsqlite(filename=self.test_db)
+        await db.start()
+
+        tasks = [
+            Task(
+                Instruction.ADD,
+                Record(
+                    f"record{i}",
+                    "site",
+                    "user",
+                    "group",
+                    Components().add_component(
+                        "comp1", 1, Scores().add_score("score1", 2.0)
+                    ),
+                ),
+                5,
+            )
+            for i in range(10)
+        ]
+
+        await db.put_many(tasks)
+
+        self.assertEqual(await db.get_all(), tasks)
+
+        # storing tasks again replaces them instead of failing
+        tasks[0] = Task(Instruction.ADD, tasks[0].record(), 2).with_schedule_after(
+            datetime.datetime(2022, 1, 1, 12, tzinfo=datetime.timezone.utc)
+        )
+        tasks[1] = Task(Instruction.ADD, tasks[1].record(), 2).with_schedule_after(
+            datetime.datetime(2022, 1, 1, 12, 0, 0, 123, tzinfo=datetime.timezone.utc)
+        )
+        with self.assertLogs("auditorclient.dbsqlite.DBsqlite", level="INFO") as logs:
+            await db.put_many(tasks[:2])
+        self.assertIn("Replaced 2 tasks", logs.output[0])
+
+        stored = sorted(await db.get_all(), key=lambda t: t.record().record_id())
+        self.assertEqual(stored, tasks)
+
+        # naive timestamps are local time and are converted to UTC
+        naive = datetime.datetime(2022, 1, 1, 12)
+        await db.put(
+            Task(Instruction.ADD, tasks[2].record(), 2).with_schedule_after(naive)
+        )
+
+        stored = sorted(await db.get_all(), key=lambda t: t.record().record_id())
+        self.assertEqual(
+            stored[2].schedule_after(), naive.astimezone(datetime.timezone.utc)
+        )
+
+        await db.close()
+
+    async def test_DBsqlite_delete(self):
+        db = DBsqlite(filename=self.test_db)
+        await db.start()
+
+        record = Record(
+            "record'1",
+            "site",
+            "user",
+            "group",
+            Components().add_component("comp1", 1, Scores().add_score("score1", 2.0)),
+        )
+        add = Task(Instruction.ADD, record, 5)
+        update = Task(Instruction.UPDATE, record, 5)
+        await db.put_many([add, update])
+
+        await db.delete(add)
+        self.assertEqual(await db.get_all(), [update])
+
+        await db.delete(update)
+        self.assertEqual(await db.get_all(), [])
+
+        await db.close()
@@ -1,4 +1,5 @@
 import asyncio
+import datetime
 from auditorclient.db import MockDB
 from auditorclient.queue import Queue
 from auditorclient.task import Task, Instruction
@@ -45,3 +46,87 @@ class TestQueue(IsolatedAsyncioTestCase):
 
         await queue.join()
         self.assertEqual(mock_db.get_counts(), [1, 1, 1, 1, 2])
+
+    async def test_queue_put_many(self):
+        mock_db = MockDB(empty_db=True)
+        queue = Queue(db=mock_db)
+        await queue.start()
+
+        tasks = [
+            Task(
+                Instruction.ADD,
+                Record(
+                    f"from_test_{i}",
+                    "site",
+                    "user",
+                    "group",
+                    Components().add_component(
+                        "comp1", 1, Scores().add_score("score1", 2.0)
+                    ),
+                ),
+                5,
+            )
+            for i in range(2)
+        ]
+        await queue.put_many(tasks)
+        self.assertEqual(mock_db.get_counts(), [1, 0, 1, 2, 0])
+
+        for i in range(2):
+            task = await queue.get()
+            self.assertEqual(task.record().record_id(), f"from_test_{i}")
+            queue.task_done()
+        self.assertEqual(mock_db.get_counts(), [1, 0, 1, 2, 2])
+
+        await queue.join()
+        self.assertEqual(mock_db.get_counts(), [1, 1, 1, 2, 2])
+
+    async def test_queue_naive_schedule_after(self):
+        mock_db = MockDB(empty_db=True)
+        queue = Queue(db=mock_db)
+
+        task = Task(
+            Instruction.ADD,
+            Record(
+                "from_test",
+                "site",
+                "user",
+                "group",
+                Components().add_component(
+                    "comp1", 1, Scores().add_score("score1", 2.0)
+                ),
+            ),
+            5,
+        ).with_schedule_after(datetime.datetime(1992, 11, 3))
+        await mock_db.put(task)
+        await queue.start()
+
+        self.assertEqual(await queue.get(), task)
+        queue.task_done()
+        await queue.join()
+
+    async def test_queue_replaces_duplicate_tasks(self):
+        queue = Queue(db=None)
+        await queue.start()
+
+        record = Record(
+            "from_test",
+            "site",
+            "user",
+            "group",
+            Components().add_component("comp1", 1, Scores().add_score("score1", 2.0)),
+        )
+        await queue.put(Task(Instruction.ADD, record, 5))
+        await queue.put(Task(Instruction.ADD, record, 2))
+        await queue.put_many(
+            [Task(Instruction.UPDATE, record, 5), Task(Instruction.UPDATE, record, 3)]
+        )
+
+        # only the newest task per record and instruction is returned
+        task = await queue.get()
+        self.assertEqual(task, Task(Instruction.ADD, record, 2))
+        queue.task_done()
+        task = await queue.get()
+        self.assertEqual(task, Task(Instruction.UPDATE, record, 3))
+        queue.task_done()
+
+        await asyncio.wait_for(queue.join(), timeout=5)
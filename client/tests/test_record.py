@@ -1,4 +1,5 @@
 from unittest import TestCase
+import json
 from auditorclient.record import Record, Components, Scores
 from auditorclient.errors import InsufficientParametersError
 
@@ -37,6 +38,13 @@ class TestComponents(TestCase):
         )
         self.assertEqual(comp.__str__(), comp._components.__str__())
 
+    def test_components_from_list(self):
+        comp = Components().add_component("blaah", 1, Scores().add_score("score1", 1.2))
+        copy = Components.from_list(comp.get())
+        self.assertEqual(copy, comp)
+        self.assertIsNot(copy.get()[0], comp.get()[0])
+        self.assertEqual(Components.from_list([]), Components())
+
 
 class TestRecord(TestCase):
     def test_record(self):
@@ -120,6 +128,41 @@ class TestRecord(TestCase):
             + '"start_time": "time1", "stop_time": "time2"}',
         )
 
+        record.with_stop_time("time3")
+        self.assertEqual(
+            record.as_json(),
+            '{"record_id": "record", "site_id": "site", "user_id": "user", '
+            + '"group_id": "group", '
+            + '"components": [{"name": "comp1", "amount": 1, '
+            + '"scores": [{"name": "score1", "factor": 2.0}]}], '
+            + '"start_time": "time1", "stop_time": "time3"}',
+        )
+
+    def test_record_components_changed_after_as_json(self):
+        components = Components().add_component(
+            "comp1", 1, Scores().add_score("score1", 2.0)
+        )
+        record = Record("record", "site", "user", "group", components)
+        serialized = record.as_json()
+
+        # the record owns a copy of the components, hence it is not affected
+        components.add_component("comp2", 2)
+        self.assertEqual(record.as_json(), serialized)
+        self.assertEqual(record.as_json(), json.dumps(record.as_dict()))
+        self.assertEqual(len(record.as_dict()["components"]), 1)
+
+    def test_record_from_json_with_non_finite_floats(self):
+        record = Record(
+            "record",
+            "site",
+            "user",
+            "group",
+            Components().add_component(
+                "comp1", 1, Scores().add_score("score1", float("inf"))
+            ),
+        )
+        self.assertEqual(Record(json_str=record.as_json()), record)
+
     def test_record_from_json(self):
         record = Record(
             json_str='{"record_id": "record", "site_id": "site", "user_id": "user", '
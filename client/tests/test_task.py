@@ -19,7 +19,7 @@ class TestTask(TestCase):
     @mock.patch("auditorclient.task.datetime", wraps=datetime)
     def test_task(self, mock_datetime):
         mock_datetime.datetime.now.return_value = datetime.datetime(
-            1992, 11, 3, 0, 0, 0
+            1992, 11, 3, 0, 0, 0, tzinfo=datetime.timezone.utc
         )
         record = Record(
             "record",
@@ -52,3 +52,17 @@ class TestTask(TestCase):
         for _i in range(retries - 1):
             task1.try_once()
         self.assertEqual(task1.try_once(), False)
+
+    def test_task_naive_schedule_after(self):
+        record = Record(
+            "record",
+            "site",
+            "user",
+            "group",
+            Components().add_component("comp1", 1, Scores().add_score("score1", 2.0)),
+        )
+        naive = datetime.datetime(1992, 11, 3, 0, 0, 0)
+        task = Task(Instruction.ADD, record, 5).with_schedule_after(naive)
+        self.assertEqual(task.schedule_after(), naive.astimezone(datetime.timezone.utc))
+        self.assertEqual(task.schedule_after().tzinfo, datetime.timezone.utc)
+        self.assertIsNone(task.with_schedule_after(None).schedule_after())
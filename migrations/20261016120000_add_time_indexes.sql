@@ -0,0 +1,3 @@
+-- Index start and stop times for the get/{started,stopped}/since queries
+CREATE INDEX accounting_start_time_idx ON accounting (start_time) WHERE runtime IS NOT NULL;
+CREATE INDEX accounting_stop_time_idx ON accounting (stop_time) WHERE runtime IS NOT NULL;
@@ -14,25 +14,32 @@ use reqwest;
 static APP_USER_AGENT: &str = concat!(env!("CARGO_PKG_NAME"), "/", env!("CARGO_PKG_VERSION"),);
 
 pub struct AuditorClient {
-    address: String,
+    health_check_url: String,
+    add_url: String,
+    bulk_add_url: String,
+    update_url: String,
+    get_url: String,
     client: reqwest::Client,
 }
 
 impl AuditorClient {
     pub fn new<T: AsRef<str>>(address: &T, port: u16) -> Result<AuditorClient, reqwest::Error> {
-        Ok(AuditorClient {
-            address: format!("http://{}:{}", address.as_ref(), port),
-            client: reqwest::ClientBuilder::new()
-                .user_agent(APP_USER_AGENT)
-                .build()?,
-        })
+        AuditorClient::with_address(format!("http://{}:{}", address.as_ref(), port))
     }
 
     pub fn from_connection_string<T: AsRef<str>>(
         connection_string: &T,
     ) -> Result<AuditorClient, reqwest::Error> {
+        AuditorClient::with_address(connection_string.as_ref().into())
+    }
+
+    fn with_address(address: String) -> Result<AuditorClient, reqwest::Error> {
         Ok(AuditorClient {
-            address: connection_string.as_ref().into(),
+            health_check_url: format!("{}/health_check", &address),
+            add_url: format!("{}/add", &address),
+            bulk_add_url: format!("{}/add/bulk", &address),
+            update_url: format!("{}/update", &address),
+            get_url: format!("{}/get", &address),
             client: reqwest::ClientBuilder::new()
                 .user_agent(APP_USER_AGENT)
                 .build()?,
@@ -41,13 +48,7 @@ impl AuditorClient {
 
     #[tracing::instrument(name = "Checking health of AUDITOR server.", skip(self))]
     pub async fn health_check(&self) -> bool {
-        matches!(
-            self.client
-                .get(&format!("{}/health_check", &self.address))
-                .send()
-                .await,
-            Ok(_)
-        )
+        matches!(self.client.get(&self.health_check_url).send().await, Ok(_))
     }
 
     #[tracing::instrument(
@@ -57,7 +58,7 @@ impl AuditorClient {
     )]
     pub async fn add(&self, record: RecordAdd) -> Result<(), reqwest::Error> {
         self.client
-            .post(&format!("{}/add", &self.address))
+            .post(&self.add_url)
             .header("Content-Type", "application/json")
             .json(&record)
             .send()
@@ -65,6 +66,21 @@ impl AuditorClient {
         Ok(())
     }
 
+    #[tracing::instrument(
+        name = "Sending multiple records to AUDITOR server.",
+        skip(self, records),
+        fields(num_records = %records.len())
+    )]
+    pub async fn bulk_insert(&self, records: &[RecordAdd]) -> Result<(), reqwest::Error> {
+        self.client
+            .post(&self.bulk_add_url)
+            .header("Content-Type", "application/json")
+            .json(records)
+            .send()
+            .await?;
+        Ok(())
+    }
+
     #[tracing::instrument(
         name = "Sending a record update to AUDITOR server.",
         skip(self, record),
@@ -72,7 +88,7 @@ impl AuditorClient {
     )]
     pub async fn update(&self, record: RecordUpdate) -> Result<(), reqwest::Error> {
         self.client
-            .post(&format!("{}/update", &self.address))
+            .post(&self.update_url)
             .header("Content-Type", "application/json")
             .json(&record)
             .send()
@@ -82,12 +98,7 @@ impl AuditorClient {
 
     #[tracing::instrument(name = "Getting all records from AUDITOR server.", skip(self))]
     pub async fn get(&self) -> Result<Vec<Record>, reqwest::Error> {
-        self.client
-            .get(&format!("{}/get", &self.address))
-            .send()
-            .await?
-            .json()
-            .await
+        self.client.get(&self.get_url).send().await?.json().await
     }
 
     #[tracing::instrument(
@@ -99,31 +110,33 @@ impl AuditorClient {
         &self,
         since: DateTime<Utc>,
     ) -> Result<Vec<Record>, reqwest::Error> {
-        self.client
-            .get(&format!(
-                "{}/get/started/since/{}",
-                &self.address,
-                since.to_rfc3339()
-            ))
-            .send()
-            .await?
-            .json()
-            .await
+        self.get_since("started", since).await
     }
 
     #[tracing::instrument(
         name = "Getting all records stopped since a given date from AUDITOR server.",
         skip(self),
-        fields(started_since = %since)
+        fields(stopped_since = %since)
     )]
     pub async fn get_stopped_since(
         &self,
         since: DateTime<Utc>,
+    ) -> Result<Vec<Record>, reqwest::Error> {
+        self.get_since("stopped", since).await
+    }
+
+    // Both `get_*_since` endpoints only differ in which timestamp they filter on, therefore they
+    // share a single implementation instead of two copies of the request logic.
+    async fn get_since(
+        &self,
+        field: &str,
+        since: DateTime<Utc>,
     ) -> Result<Vec<Record>, reqwest::Error> {
         self.client
             .get(&format!(
-                "{}/get/stopped/since/{}",
-                &self.address,
+                "{}/{}/since/{}",
+                &self.get_url,
+                field,
                 since.to_rfc3339()
             ))
             .send()
@@ -5,6 +5,8 @@
 // http://opensource.org/licenses/MIT>, at your option. This file may not be
 // copied, modified, or distributed except according to those terms.
 
+use regex::Regex;
+use serde::{Deserialize, Deserializer};
 use serde_aux::field_attributes::deserialize_number_from_string;
 
 #[derive(serde::Deserialize, Debug, Clone)]
@@ -41,7 +43,18 @@ pub struct ScoreConfig {
 #[derive(serde::Deserialize, Debug, Clone)]
 pub struct OnlyIf {
     pub key: String,
-    pub matches: String,
+    #[serde(deserialize_with = "deserialize_regex")]
+    pub matches: Regex,
+}
+
+/// Compiles the regex when the configuration is loaded instead of every time it is used.
+fn deserialize_regex<'de, D>(deserializer: D) -> Result<Regex, D::Error>
+where
+    D: Deserializer<'de>,
+{
+    let s = String::deserialize(deserializer)?;
+    Regex::new(&s)
+        .map_err(|e| serde::de::Error::custom(format!("Invalid regex expression {}: {}", s, e)))
 }
 
 fn default_addr() -> String {
@@ -7,11 +7,10 @@
 
 use anyhow::Error;
 use auditor::client::AuditorClient;
-use auditor::constants::FORBIDDEN_CHARACTERS;
+use auditor::constants::{FORBIDDEN_BYTES, FORBIDDEN_CHARACTERS};
 use auditor::domain::{Component, RecordAdd, Score};
 use auditor::telemetry::{get_subscriber, init_subscriber};
 use chrono::{DateTime, NaiveDateTime, Utc};
-use regex::Regex;
 use std::collections::HashMap;
 use std::env;
 use std::fmt;
@@ -39,10 +38,8 @@ fn get_slurm_job_info(job_id: u64) -> Result<Job, Error> {
             .stdout,
     )?
     .split_whitespace()
-    .map(|s| {
-        let t = s.split('=').take(2).collect::<Vec<_>>();
-        (t[0].to_string(), t[1].to_string())
-    })
+    .filter_map(|s| s.split_once('='))
+    .map(|(k, v)| (k.to_string(), v.to_string()))
     .collect())
 }
 
@@ -58,7 +55,12 @@ fn parse_slurm_timestamp<T: AsRef<str> + std::fmt::Debug>(
 
 #[tracing::instrument(name = "Remove forbidden characters from string", level = "debug")]
 fn make_string_valid<T: AsRef<str> + fmt::Debug>(input: T) -> String {
-    input.as_ref().replace(&FORBIDDEN_CHARACTERS[..], "")
+    let input = input.as_ref();
+    // Most strings do not contain any forbidden character, those can be copied as they are.
+    if !input.bytes().any(|b| FORBIDDEN_BYTES[b as usize]) {
+        return input.to_string();
+    }
+    input.replace(&FORBIDDEN_CHARACTERS[..], "")
 }
 
 #[tracing::instrument(
@@ -69,18 +71,15 @@ fn construct_components(config: &configuration::Settings, job: &Job) -> Vec<Comp
     config
         .components
         .iter()
-        .cloned()
         .filter(|c| {
             c.only_if.is_none() || {
                 let only_if = c.only_if.as_ref().unwrap();
-                let re = Regex::new(&only_if.matches)
-                    .unwrap_or_else(|_| panic!("Invalid regex expression: {}", &only_if.matches));
-                re.is_match(&job[&only_if.key])
+                only_if.matches.is_match(&job[&only_if.key])
             }
         })
         .map(|c| {
             Component::new(
-                make_string_valid(c.name),
+                make_string_valid(&c.name),
                 job[&c.key].parse().unwrap_or_else(|_| {
                     panic!(
                         "Cannot parse key {} (value: {}) into u64.",
@@ -92,10 +91,7 @@ fn construct_components(config: &configuration::Settings, job: &Job) -> Vec<Comp
                     .filter(|s| {
                         s.only_if.is_none() || {
                             let only_if = s.only_if.as_ref().unwrap();
-                            let re = Regex::new(&only_if.matches).unwrap_or_else(|_| {
-                                panic!("Invalid regex expression: {}", &only_if.matches)
-                            });
-                            re.is_match(&job[&only_if.key])
+                            only_if.matches.is_match(&job[&only_if.key])
                         }
                     })
                     .map(|s| {
@@ -138,8 +134,8 @@ async fn main() -> Result<(), Error> {
     let record = RecordAdd::new(
         format!("{}-{}", make_string_valid(&config.record_prefix), job_id),
         make_string_valid(&config.site_id),
-        make_string_valid(&job["UserId"].split('(').take(1).collect::<Vec<_>>()[0]),
-        make_string_valid(&job["GroupId"].split('(').take(1).collect::<Vec<_>>()[0]),
+        make_string_valid(job["UserId"].split('(').next().unwrap_or_default()),
+        make_string_valid(job["GroupId"].split('(').next().unwrap_or_default()),
         construct_components(&config, &job),
         parse_slurm_timestamp(&job["StartTime"])?,
     )
@@ -6,3 +6,23 @@
 // copied, modified, or distributed except according to those terms.
 
 pub const FORBIDDEN_CHARACTERS: [char; 9] = ['/', '(', ')', '"', '<', '>', '\\', '{', '}'];
+
+/// Maximum size in bytes of the JSON body accepted by `/add/bulk`. actix-web's default of 2 MB
+/// would only allow for a few thousand records per request.
+pub const BULK_ADD_PAYLOAD_LIMIT: usize = 64 * 1024 * 1024;
+
+/// Lookup table indexed by byte value which marks the bytes of `FORBIDDEN_CHARACTERS`. Since all
+/// forbidden characters are ASCII, they never occur within a multi-byte UTF-8 sequence and can be
+/// detected by looking at the bytes of a string alone.
+pub const FORBIDDEN_BYTES: [bool; 256] = forbidden_bytes();
+
+const fn forbidden_bytes() -> [bool; 256] {
+    let mut table = [false; 256];
+    let mut i = 0;
+    while i < FORBIDDEN_CHARACTERS.len() {
+        assert!(FORBIDDEN_CHARACTERS[i].is_ascii());
+        table[FORBIDDEN_CHARACTERS[i] as usize] = true;
+        i += 1;
+    }
+    table
+}
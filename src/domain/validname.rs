@@ -5,7 +5,7 @@
 // http://opensource.org/licenses/MIT>, at your option. This file may not be
 // copied, modified, or distributed except according to those terms.
 
-use crate::constants::FORBIDDEN_CHARACTERS;
+use crate::constants::FORBIDDEN_BYTES;
 use std::fmt;
 use unicode_segmentation::UnicodeSegmentation;
 
@@ -22,10 +22,11 @@ impl ValidName {
     pub fn parse(s: String) -> Result<ValidName, String> {
         // remove trailing whitespace and check if string is then empty
         let is_empty_or_whitespace = s.trim().is_empty();
-        // count characters
-        let is_too_long = s.graphemes(true).count() > 256;
+        // count characters. A grapheme consists of at least one byte, therefore segmenting the
+        // string is only necessary if it is longer than 256 bytes.
+        let is_too_long = s.len() > 256 && s.graphemes(true).count() > 256;
         // check for forbidden characters
-        let contains_forbidden_characters = s.chars().any(|g| FORBIDDEN_CHARACTERS.contains(&g));
+        let contains_forbidden_characters = s.bytes().any(|b| FORBIDDEN_BYTES[b as usize]);
         if is_empty_or_whitespace || is_too_long || contains_forbidden_characters {
             Err(format!("Invalid Name: {}", s))
         } else {
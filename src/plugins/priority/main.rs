@@ -11,7 +11,6 @@ use auditor::domain::Record;
 use auditor::telemetry::{get_subscriber, init_subscriber};
 use chrono::Utc;
 use configuration::Settings;
-use num_traits::cast::FromPrimitive;
 use std::collections::HashMap;
 use std::process::Command;
 use tracing::{debug, error, info, warn};
@@ -40,7 +39,7 @@ fn extract(records: Vec<Record>, config: &Settings) -> HashMap<ResourceName, Res
 
     for r in records {
         let val: f64 = if let Some(runtime) = r.runtime {
-            f64::from_i64(runtime).unwrap()
+            runtime as f64
                 * if r.components.is_none() {
                     if !config.components.is_empty() {
                         error!(
@@ -54,26 +53,16 @@ fn extract(records: Vec<Record>, config: &Settings) -> HashMap<ResourceName, Res
                     match r.components.as_ref().unwrap().iter().fold(
                         (1.0, false),
                         |(acc, found), c| {
-                            if config.components.contains_key(c.name.as_ref()) {
+                            if let Some(score_name) = config.components.get(c.name.as_ref()) {
                                 (
-                                    acc * f64::from_i64(*c.amount.as_ref()).unwrap()
-                                        * match c.scores.iter().fold(
-                                            (1.0, false),
-                                            |(acc, found), s| {
-                                                if s.name.as_ref()
-                                                    == config
-                                                        .components
-                                                        .get(c.name.as_ref())
-                                                        .unwrap()
-                                                {
-                                                    (*s.factor.as_ref(), true)
-                                                } else {
-                                                    (acc, found)
-                                                }
-                                            },
-                                        ) {
-                                            (acc, true) => acc,
-                                            (_, false) => {
+                                    acc * *c.amount.as_ref() as f64
+                                        * match c
+                                            .scores
+                                            .iter()
+                                            .find(|s| s.name.as_ref() == score_name)
+                                        {
+                                            Some(s) => *s.factor.as_ref(),
+                                            None => {
                                                 error!(
                                                     record_id = %r.record_id,
                                                     concat!(
@@ -107,10 +96,10 @@ fn extract(records: Vec<Record>, config: &Settings) -> HashMap<ResourceName, Res
         };
         // If no group_id is present in the record, then record will be silently ignored
         if let Some(group_id) = r.group_id.as_ref() {
-            // Only consider configured groups
-            if config.group_mapping.contains_key(group_id) {
-                // we know that the key exists (we filled it beforehand), therefore we can unwrap
-                *resources.get_mut(group_id).unwrap() += val;
+            // Only consider configured groups. `resources` was filled with exactly these groups
+            // beforehand, hence a single lookup is sufficient.
+            if let Some(resource) = resources.get_mut(group_id) {
+                *resource += val;
             }
         } else {
             error!(record_id = %r.record_id, "Record without group_id, ignoring.");
@@ -135,16 +124,17 @@ fn compute_priorities(
         },
     );
 
-    let max_priority = f64::from_u64(config.max_priority).unwrap();
-    let min_priority = f64::from_u64(config.min_priority).unwrap();
+    let max_priority = config.max_priority as f64;
+    let min_priority = config.min_priority as f64;
+
+    let scale = (max_priority - min_priority) / (v_max - v_min);
 
     resources
         .iter()
         .map(|(k, v)| {
             (
                 k.clone(),
-                ((v - v_min) / (v_max - v_min) * (max_priority - min_priority) + min_priority)
-                    .round() as i64,
+                ((v - v_min) * scale + min_priority).round() as i64,
             )
         })
         .collect()
@@ -158,16 +148,54 @@ fn construct_command(
     group: &String,
     params: &[String],
 ) -> Vec<String> {
+    let priority = priority.to_string();
+    let resource = resource.to_string();
+    let substitutions: Vec<(String, &str)> = [
+        ("{priority}".to_string(), priority.as_str()),
+        ("{resource}".to_string(), resource.as_str()),
+        ("{group}".to_string(), group.as_str()),
+    ]
+    .into_iter()
+    .chain(
+        params
+            .iter()
+            .enumerate()
+            .map(|(index, p)| (format!("{{{}}}", index + 1), p.as_str())),
+    )
+    .collect();
+
     cmd.iter()
-        .map(|c| c.replace("{priority}", &format!("{}", priority)))
-        .map(|c| c.replace("{resource}", &format!("{}", resource)))
-        .map(|c| c.replace("{group}", group))
         .map(|c| {
-            let mut cc = c;
-            for (index, p) in params.iter().enumerate() {
-                cc = cc.replace(&format!("{{{}}}", index + 1), p);
+            // Most arguments are plain words without any placeholder, those are taken as is.
+            if !c.contains('{') {
+                return c.clone();
+            }
+            // Otherwise the argument is rendered in a single pass, copying the text between
+            // placeholders and replacing each placeholder with its value. Inserted values are
+            // not scanned for placeholders again.
+            let mut rendered = String::with_capacity(c.len());
+            let mut rest = c.as_str();
+            while let Some(start) = rest.find('{') {
+                rendered.push_str(&rest[..start]);
+                rest = &rest[start..];
+                let substitution = rest.find('}').and_then(|end| {
+                    substitutions
+                        .iter()
+                        .find(|(placeholder, _)| *placeholder == rest[..=end])
+                });
+                match substitution {
+                    Some((placeholder, value)) => {
+                        rendered.push_str(value);
+                        rest = &rest[placeholder.len()..];
+                    }
+                    None => {
+                        rendered.push('{');
+                        rest = &rest[1..];
+                    }
+                }
             }
-            cc
+            rendered.push_str(rest);
+            rendered
         })
         .collect()
 }
@@ -178,29 +206,36 @@ fn set_priorities(
     resources: &HashMap<ResourceName, ResourceValue>,
     config: &Settings,
 ) -> Result<(), Error> {
+    // Only set priority if group actually exists.
+    let groups = config
+        .group_mapping
+        .iter()
+        .filter_map(|(group, params)| {
+            priorities
+                .get(group)
+                .map(|prio| (group, params, *prio, *resources.get(group).unwrap()))
+        })
+        .collect::<Vec<_>>();
+
     for command in config.commands.iter() {
         let command = shell_words::split(command)?;
-        for (group, params) in config.group_mapping.iter() {
-            // Only set priority if group actually exists.
-            if let Some(prio) = priorities.get(group) {
-                let resource = resources.get(group).unwrap();
-                let command = construct_command(&command.clone(), *prio, *resource, group, params);
+        for (group, params, prio, resource) in groups.iter() {
+            let command = construct_command(&command, *prio, *resource, group, params);
 
-                let mut cmd = Command::new(&command[0]);
-                cmd.args(&command[1..]);
+            let mut cmd = Command::new(&command[0]);
+            cmd.args(&command[1..]);
 
-                debug!(?cmd, "Constructed command");
+            debug!(?cmd, "Constructed command");
 
-                let status = cmd.status().map_err(|e| {
-                    error!("Executing command failed!");
-                    e
-                })?;
+            let status = cmd.status().map_err(|e| {
+                error!("Executing command failed!");
+                e
+            })?;
 
-                debug!(?status, "Command status");
+            debug!(?status, "Command status");
 
-                if !status.success() {
-                    error!("Setting priority failed!");
-                }
+            if !status.success() {
+                error!("Setting priority failed!");
             }
         }
     }
@@ -293,4 +328,22 @@ mod tests {
         assert_eq!(cmd[5], "SomeResourceStuff=1.2");
         assert_eq!(cmd[6], "SomethingElse=blah");
     }
+
+    #[test]
+    fn test_construct_command_keeps_unknown_placeholders() {
+        let cmd = vec![
+            "{group}{1}".to_string(),
+            "{unknown}={group}".to_string(),
+            "{{priority}}".to_string(),
+            "{3}{1".to_string(),
+        ];
+        let group = "{1}".to_string();
+        let params = vec!["a".to_string(), "b".to_string()];
+
+        let cmd = construct_command(&cmd, 10, 1.2, &group, &params);
+        assert_eq!(cmd[0], "{1}a");
+        assert_eq!(cmd[1], "{unknown}={1}");
+        assert_eq!(cmd[2], "{10}");
+        assert_eq!(cmd[3], "{3}{1");
+    }
 }
@@ -9,7 +9,10 @@ use crate::domain::RecordAdd;
 use actix_web::{web, HttpResponse};
 use chrono::Utc;
 use sqlx;
-use sqlx::PgPool;
+use sqlx::{postgres::PgExecutor, PgPool};
+
+// Postgres error code of `unique_violation`.
+const UNIQUE_VIOLATION: &str = "23505";
 
 #[tracing::instrument(
     name = "Adding a record to the database",
@@ -17,14 +20,55 @@ use sqlx::PgPool;
     fields(record_id = %record.record_id)
 )]
 pub async fn add(record: web::Json<RecordAdd>, pool: web::Data<PgPool>) -> HttpResponse {
-    match add_record(&record, &pool).await {
+    match add_record(&record, pool.get_ref()).await {
+        Ok(_) => HttpResponse::Ok().finish(),
+        Err(_) => HttpResponse::InternalServerError().finish(),
+    }
+}
+
+#[tracing::instrument(
+    name = "Adding multiple records to the database",
+    skip(records, pool),
+    fields(num_records = %records.len())
+)]
+pub async fn bulk_add(records: web::Json<Vec<RecordAdd>>, pool: web::Data<PgPool>) -> HttpResponse {
+    match bulk_add_records(&records, &pool).await {
         Ok(_) => HttpResponse::Ok().finish(),
+        // A record which exists already (or occurs twice in the batch) violates the unique
+        // constraint on record_id. The whole batch is rolled back in this case.
+        Err(sqlx::Error::Database(e)) if e.code().as_deref() == Some(UNIQUE_VIOLATION) => {
+            HttpResponse::Conflict().finish()
+        }
         Err(_) => HttpResponse::InternalServerError().finish(),
     }
 }
 
-#[tracing::instrument(name = "Inserting record into database", skip(record, pool))]
-pub async fn add_record(record: &RecordAdd, pool: &PgPool) -> Result<(), sqlx::Error> {
+#[tracing::instrument(name = "Inserting records into database", skip(records, pool))]
+pub async fn bulk_add_records(records: &[RecordAdd], pool: &PgPool) -> Result<(), sqlx::Error> {
+    // All records are inserted in a single transaction, such that either all or none of them
+    // end up in the database and only one commit is needed for the whole batch.
+    let mut transaction = pool.begin().await.map_err(|e| {
+        tracing::error!("Failed to begin transaction: {:?}", e);
+        e
+    })?;
+
+    for record in records {
+        add_record(record, &mut transaction).await?;
+    }
+
+    transaction.commit().await.map_err(|e| {
+        tracing::error!("Failed to commit transaction: {:?}", e);
+        e
+    })?;
+
+    Ok(())
+}
+
+#[tracing::instrument(name = "Inserting record into database", skip(record, executor))]
+pub async fn add_record<'a, E: PgExecutor<'a>>(
+    record: &RecordAdd,
+    executor: E,
+) -> Result<(), sqlx::Error> {
     let runtime = match record.stop_time.as_ref() {
         Some(&stop) => Some((stop - record.start_time).num_seconds()),
         _ => None,
@@ -48,7 +92,7 @@ pub async fn add_record(record: &RecordAdd, pool: &PgPool) -> Result<(), sqlx::E
         runtime,
         Utc::now()
     )
-    .execute(pool)
+    .execute(executor)
     .await
     .map_err(|e| {
         tracing::error!("Failed to execute query: {:?}", e);
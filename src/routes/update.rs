@@ -29,29 +29,14 @@ pub async fn update(record: web::Json<RecordUpdate>, pool: web::Data<PgPool>) ->
 
 #[tracing::instrument(name = "Updating a record in the database", skip(record, pool))]
 pub async fn update_record(record: &RecordUpdate, pool: &PgPool) -> Result<(), sqlx::Error> {
-    // TODO: Can and probably should be merged into a single query.
-    let start_time = sqlx::query!(
-        r#"
-        SELECT start_time
-        FROM accounting 
-        WHERE record_id = $1
-        "#,
-        record.record_id.as_ref(),
-    )
-    .fetch_one(pool)
-    .await
-    .map_err(|e| {
-        tracing::error!("Failed to execute query: {:?}", e);
-        e
-    })?
-    .start_time;
-
-    sqlx::query_unchecked!(
+    // The runtime is computed from the stored start_time within the same statement, which
+    // saves a round trip to the database for fetching the start_time first.
+    let result = sqlx::query_unchecked!(
         r#"
         UPDATE accounting
         SET stop_time = $6,
-            runtime = $7,
-            updated_at = $8
+            runtime = TRUNC(EXTRACT(EPOCH FROM ($6 - start_time)))::BIGINT,
+            updated_at = $7
         WHERE
             record_id = $1 and site_id = $2 and user_id = $3 and group_id = $4 and components = $5
         "#,
@@ -61,7 +46,6 @@ pub async fn update_record(record: &RecordUpdate, pool: &PgPool) -> Result<(), s
         record.group_id.as_ref(),
         record.components,
         record.stop_time,
-        (record.stop_time - start_time).num_seconds(),
         Utc::now()
     )
     .execute(pool)
@@ -70,5 +54,11 @@ pub async fn update_record(record: &RecordUpdate, pool: &PgPool) -> Result<(), s
         tracing::error!("Failed to execute query: {:?}", e);
         e
     })?;
+
+    if result.rows_affected() == 0 {
+        tracing::error!("Record to update does not exist");
+        return Err(sqlx::Error::RowNotFound);
+    }
+
     Ok(())
 }
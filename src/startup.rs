@@ -5,7 +5,8 @@
 // http://opensource.org/licenses/MIT>, at your option. This file may not be
 // copied, modified, or distributed except according to those terms.
 
-use crate::routes::{add, get, get_since, health_check, update};
+use crate::constants::BULK_ADD_PAYLOAD_LIMIT;
+use crate::routes::{add, bulk_add, get, get_since, health_check, update};
 use actix_web::dev::Server;
 use actix_web::{web, App, HttpServer};
 use sqlx::PgPool;
@@ -22,6 +23,11 @@ pub fn run(listener: TcpListener, db_pool: PgPool) -> Result<Server, std::io::Er
             // Routes
             .route("/health_check", web::get().to(health_check))
             .route("/add", web::post().to(add))
+            .service(
+                web::resource("/add/bulk")
+                    .app_data(web::JsonConfig::default().limit(BULK_ADD_PAYLOAD_LIMIT))
+                    .route(web::post().to(bulk_add)),
+            )
             .route("/update", web::post().to(update))
             .route("/get", web::get().to(get))
             .route("/get/{startstop}/since/{date}", web::get().to(get_since))
@@ -151,3 +151,157 @@ async fn add_returns_a_400_when_data_is_missing() {
         );
     }
 }
+
+#[tokio::test]
+async fn bulk_add_returns_a_200_for_valid_json_data() {
+    // Arange
+    let app = spawn_app().await;
+    let client = reqwest::Client::new();
+
+    let body: Vec<RecordTest> = (0..100).map(|_| Faker.fake()).collect();
+
+    // Act
+    let response = client
+        .post(&format!("{}/add/bulk", &app.address))
+        .header("Content-Type", "application/json")
+        .json(&body)
+        .send()
+        .await
+        .expect("Failed to execute request.");
+
+    assert_eq!(200, response.status().as_u16());
+
+    for record in body {
+        let saved = sqlx::query_as!(
+            Record,
+            r#"SELECT
+           record_id, site_id, user_id, group_id, components as "components: Vec<Component>",
+           start_time, stop_time, runtime
+           FROM accounting
+           WHERE record_id = $1
+        "#,
+            record.record_id.as_ref().unwrap(),
+        )
+        .fetch_one(&app.db_pool)
+        .await
+        .expect("Failed to fetch data.");
+
+        assert_eq!(record, saved);
+    }
+}
+
+#[tokio::test]
+async fn bulk_add_returns_a_400_and_stores_nothing_if_one_record_is_invalid() {
+    // Arange
+    let app = spawn_app().await;
+    let client = reqwest::Client::new();
+
+    let mut body: Vec<RecordTest> = (0..10).map(|_| Faker.fake()).collect();
+    body[5].site_id = Some("test/test".to_string());
+
+    // Act
+    let response = client
+        .post(&format!("{}/add/bulk", &app.address))
+        .header("Content-Type", "application/json")
+        .json(&body)
+        .send()
+        .await
+        .expect("Failed to execute request.");
+
+    assert_eq!(400, response.status().as_u16());
+
+    for record in body {
+        let saved = sqlx::query!(
+            r#"SELECT
+                   record_id, site_id, user_id, group_id,
+                   components as "components: Vec<Component>",
+                   start_time, stop_time, runtime
+                   FROM accounting
+                   WHERE record_id = $1
+                "#,
+            record.record_id.as_ref().unwrap(),
+        )
+        .fetch_all(&app.db_pool)
+        .await
+        .expect("Failed to fetch data.");
+
+        assert_eq!(saved.len(), 0);
+    }
+}
+
+#[tokio::test]
+async fn bulk_add_returns_a_409_and_stores_nothing_if_one_record_id_is_duplicated() {
+    // Arange
+    let app = spawn_app().await;
+    let client = reqwest::Client::new();
+
+    let mut body: Vec<RecordTest> = (0..10).map(|_| Faker.fake()).collect();
+    body[7].record_id = body[2].record_id.clone();
+
+    // Act
+    let response = client
+        .post(&format!("{}/add/bulk", &app.address))
+        .header("Content-Type", "application/json")
+        .json(&body)
+        .send()
+        .await
+        .expect("Failed to execute request.");
+
+    assert_eq!(409, response.status().as_u16());
+
+    for record in body {
+        let saved = sqlx::query!(
+            r#"SELECT
+                   record_id, site_id, user_id, group_id,
+                   components as "components: Vec<Component>",
+                   start_time, stop_time, runtime
+                   FROM accounting
+                   WHERE record_id = $1
+                "#,
+            record.record_id.as_ref().unwrap(),
+        )
+        .fetch_all(&app.db_pool)
+        .await
+        .expect("Failed to fetch data.");
+
+        assert_eq!(saved.len(), 0);
+    }
+}
+
+#[tokio::test]
+async fn bulk_add_accepts_batches_larger_than_the_default_json_limit() {
+    // Arange
+    let app = spawn_app().await;
+    let client = reqwest::Client::new();
+
+    // The names alone add up to more than the 2 MB default limit of actix-web.
+    let name = "a".repeat(200);
+    let body: Vec<RecordTest> = (0..4000)
+        .map(|i| {
+            Faker
+                .fake::<RecordTest>()
+                .with_record_id(format!("r{}", i))
+                .with_site_id(&name)
+                .with_user_id(&name)
+                .with_group_id(&name)
+        })
+        .collect();
+
+    // Act
+    let response = client
+        .post(&format!("{}/add/bulk", &app.address))
+        .header("Content-Type", "application/json")
+        .json(&body)
+        .send()
+        .await
+        .expect("Failed to execute request.");
+
+    assert_eq!(200, response.status().as_u16());
+
+    let count: i64 = sqlx::query_scalar("SELECT COUNT(*) FROM accounting")
+        .fetch_one(&app.db_pool)
+        .await
+        .expect("Failed to fetch data.");
+
+    assert_eq!(count, 4000);
+}
@@ -72,4 +72,5 @@ async fn update_returns_a_200_for_valid_form_data() {
     .expect("Failed to fetch data.");
 
     assert_eq!(saved, body);
+    assert_eq!(saved.runtime, Some(3600));
 }